@@ -1,10 +1,24 @@
-import inspect
-from typing import Any, Callable, TypeVar
+from typing import AbstractSet, Any, Callable, Mapping, TypeVar
 
 
 _ExtendedClass = TypeVar("_ExtendedClass", bound=type)
 """Type of the class that is being extended (the one that is passed to `extension_on` as an argument)."""
 
+_CLASS_BOOKKEEPING_NAMES = frozenset({"__module__", "__qualname__", "__doc__", "__dict__", "__weakref__"})
+"""Names Python puts in every class namespace; these describe the extension class and are never copied."""
+
+_TPFLAGS_IMMUTABLETYPE = 1 << 8
+"""`Py_TPFLAGS_IMMUTABLETYPE` bit of `type.__flags__` (set on immutable types since Python 3.10)."""
+
+_TPFLAGS_HEAPTYPE = 1 << 9
+"""`Py_TPFLAGS_HEAPTYPE` bit of `type.__flags__` (unset on static, i.e. built-in, types)."""
+
+_TYPE_DICT_DESCRIPTOR = vars(type)["__dict__"]
+"""The `type.__dict__` slot descriptor, used to read class namespaces without going through `getattr`."""
+
+_OBJECT_NAMES = frozenset(dir(object))
+"""What `_inherited_names` yields for extension classes without an explicit base (plus `__doc__`, never copied)."""
+
 
 def extension_on(extension_target: _ExtendedClass) -> Callable[[_ExtendedClass], None]:
     """
@@ -49,42 +63,52 @@ def extension_on(extension_target: _ExtendedClass) -> Callable[[_ExtendedClass],
     """
 
     def decorator(extension_class: _ExtendedClass) -> None:
-        for method_name in _non_inherited_methods_names(extension_class):
-            method = getattr(extension_class, method_name)
-            if _is_classmethod(method):
-                bound_method: classmethod[_ExtendedClass, Any, Any] = classmethod(method.__func__)
-                setattr(extension_target, method_name, bound_method)
-                return
-            if _is_staticmethod(extension_class, method_name):
-                setattr(extension_target, method_name, staticmethod(method))
-                return
+        _ensure_extensible(extension_target)
+        for method_name, method in _own_members(extension_class):
             setattr(extension_target, method_name, method)
 
     return decorator
 
 
-def _non_inherited_methods_names(cls: type) -> set[str]:
-    all_method_names = {
-        attr
-        for attr in dir(cls)
-        if callable(getattr(cls, attr)) or _is_descriptor(getattr(cls, attr))
-    }
-    parent_classes_method_names = {
-        attr
-        for base in cls.__bases__
-        for attr in dir(base)
-        if callable(getattr(base, attr)) or _is_descriptor(getattr(base, attr))
-    }
-    return all_method_names - parent_classes_method_names
+def _ensure_extensible(cls: type) -> None:
+    if not cls.__flags__ & _TPFLAGS_HEAPTYPE or cls.__flags__ & _TPFLAGS_IMMUTABLETYPE:
+        raise TypeError(f"Cannot extend built-in or immutable type {cls!r}")
 
 
-def _is_descriptor(obj: Any) -> bool:
-    return any(hasattr(obj, attr) for attr in {"__get__", "__set__", "__delete__"})
+def _own_members(cls: type) -> tuple[tuple[str, Any], ...]:
+    parent_classes_member_names = _inherited_names(cls)
+    return tuple(
+        (attr, member)
+        for attr, member in _namespace(cls).items()
+        if attr not in _CLASS_BOOKKEEPING_NAMES
+        and attr not in parent_classes_member_names
+        and _is_method_like(member)
+    )
 
 
-def _is_classmethod(obj: Any) -> bool:
-    return hasattr(obj, "__self__") and isinstance(obj.__self__, type)
+def _inherited_names(cls: type) -> AbstractSet[str]:
+    if cls.__bases__ == (object,):
+        return _OBJECT_NAMES
+    seen_names: set[str] = set()
+    names: set[str] = set()
+    for base in cls.__mro__[1:]:
+        for attr, member in _namespace(base).items():
+            if attr in seen_names:
+                continue
+            seen_names.add(attr)
+            if _is_method_like(member):
+                names.add(attr)
+    return names
 
 
-def _is_staticmethod(cls: _ExtendedClass, method_name: str) -> bool:
-    return isinstance(inspect.getattr_static(cls, method_name), staticmethod)
+def _namespace(cls: type) -> Mapping[str, Any]:
+    return _TYPE_DICT_DESCRIPTOR.__get__(cls)
+
+
+def _is_method_like(obj: Any) -> bool:
+    return callable(obj) or _is_descriptor(obj)
+
+
+def _is_descriptor(obj: Any) -> bool:
+    obj_type = type(obj)
+    return hasattr(obj_type, "__get__") or hasattr(obj_type, "__set__") or hasattr(obj_type, "__delete__")
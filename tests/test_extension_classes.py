@@ -1,3 +1,5 @@
+from typing import Any
+
 from typing_extensions import Self
 
 import pytest
@@ -102,6 +104,144 @@ def test_extension_static_methods(user_class: type) -> None:
     assert user.validate_age(150) is False
 
 
+def test_extension_class_and_static_methods_mixed_with_regular_ones(user_class: type) -> None:
+    @extension_on(user_class)
+    class _UserMixedExtension:
+        @classmethod
+        def create_adult(cls, name: str) -> Self:
+            return cls(name, 18)  # type: ignore[call-arg]
+
+        @staticmethod
+        def validate_age(age: int) -> bool:
+            return 0 <= age <= 120
+
+        def make_older(self, years: int) -> None:
+            self.age += years  # type: ignore[attr-defined]
+
+    user = user_class.create_adult("Vasi")  # type: ignore[attr-defined]
+    user.make_older(years=1)
+
+    assert user.age == 19
+    assert user.validate_age(25) is True
+
+
+def test_extension_method_shadowing_base_class_attribute(user_class: type) -> None:
+    class _BaseExtension:
+        greeting = "Hi"
+
+    @extension_on(user_class)
+    class _UserMethodsExtension(_BaseExtension):
+        def greeting(self) -> str:  # type: ignore[override]
+            return f"Hi, {self.name}"  # type: ignore[attr-defined]
+
+    user = user_class("Vasi", 25)
+
+    assert user.greeting() == "Hi, Vasi"
+
+
+def test_extension_method_shadowing_base_class_attribute_shadowing_method(user_class: type) -> None:
+    class _GrandBaseExtension:
+        def greeting(self) -> str:
+            return "Hi"
+
+    class _BaseExtension(_GrandBaseExtension):
+        greeting = "Hello"  # type: ignore[assignment]
+
+    @extension_on(user_class)
+    class _UserMethodsExtension(_BaseExtension):
+        def greeting(self) -> str:  # type: ignore[override]
+            return f"Hi, {self.name}"  # type: ignore[attr-defined]
+
+    user = user_class("Vasi", 25)
+
+    assert user.greeting() == "Hi, Vasi"
+
+
+def test_extension_class_base_methods_not_copied(user_class: type) -> None:
+    class _BaseExtension:
+        def greet(self) -> str:
+            return f"Hi, {self.name}"  # type: ignore[attr-defined]
+
+    @extension_on(user_class)
+    class _UserMethodsExtension(_BaseExtension):
+        def make_older(self, years: int) -> None:
+            self.age += years  # type: ignore[attr-defined]
+
+    user = user_class("Vasi", 25)
+    user.make_older(years=1)
+
+    assert user.age == 26
+    assert not hasattr(user, "greet")
+
+
+def test_extension_dunder_methods(user_class: type) -> None:
+    @extension_on(user_class)
+    class _UserDunderExtension:
+        def __call__(self) -> str:
+            return self.name  # type: ignore[attr-defined]
+
+        def __len__(self) -> int:
+            return len(self.name)  # type: ignore[attr-defined]
+
+    user = user_class("Vasi", 25)
+
+    assert user() == "Vasi"
+    assert len(user) == 4
+
+
+def test_extension_object_dunder_methods_not_copied(user_class: type) -> None:
+    @extension_on(user_class)
+    class _UserDunderExtension:
+        def __init__(self) -> None:
+            self.name = "Nobody"
+
+        def __repr__(self) -> str:
+            return "Nobody"
+
+    user = user_class("Vasi", 25)
+
+    assert user.name == "Vasi"
+    assert repr(user) != "Nobody"
+
+
+def test_extension_class_bookkeeping_not_copied(user_class: type) -> None:
+    user_class.__doc__ = "A user."
+
+    @extension_on(user_class)
+    class _UserDocumentedExtension:
+        """Extension methods for users."""
+
+        def make_older(self, years: int) -> None:
+            self.age += years  # type: ignore[attr-defined]
+
+    assert user_class.__doc__ == "A user."
+    assert user_class.__module__ == __name__
+    assert user_class.__qualname__ == "user_class.<locals>.User"
+
+
+def test_extension_class_applied_repeatedly(user_class: type) -> None:
+    class _UserMethodsExtension:
+        def make_older(self, years: int) -> None:
+            self.age += years  # type: ignore[attr-defined]
+
+    other_user_class: type = type("OtherUser", (user_class,), {})
+
+    extension_on(user_class)(_UserMethodsExtension)
+
+    def make_younger(self: Any, years: int) -> None:
+        self.age -= years
+
+    _UserMethodsExtension.make_younger = make_younger  # type: ignore[attr-defined]
+    extension_on(other_user_class)(_UserMethodsExtension)
+
+    user = other_user_class("Vasi", 25)
+    user.make_older(years=2)
+    user.make_younger(years=1)
+
+    assert user.age == 26
+    assert not hasattr(user_class, "make_younger")
+
+
 def test_extension_method_overriding_original(user_class: type) -> None:
     @extension_on(user_class)
     class _UserStaticmethodsExtension:
@@ -133,3 +273,26 @@ def test_expect_extending_builtins_to_fail(builtin_class: type) -> None:
         class _SomeExtension:
             def dummy_method(self) -> str:
                 return "Cannot add methods on built-in types 🥺"
+
+
+def test_expect_extending_builtins_with_empty_extension_to_fail(builtin_class: type) -> None:
+    with pytest.raises(TypeError):
+
+        @extension_on(builtin_class)
+        class _SomeExtension:
+            pass
+
+
+def test_metaclass_setattr_error_propagated() -> None:
+    class FrozenMeta(type):
+        def __setattr__(cls, name: str, value: object) -> None:
+            raise TypeError(f"{cls.__name__} is frozen")
+
+    frozen_class: type = FrozenMeta("Frozen", (), {})
+
+    with pytest.raises(TypeError, match="Frozen is frozen"):
+
+        @extension_on(frozen_class)
+        class _FrozenExtension:
+            def dummy_method(self) -> str:
+                return "Frozen classes reject new attributes"